@@ -1,32 +1,133 @@
+import os
+import hashlib
 import logging
+import tempfile
 import time
+from io import BytesIO
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlencode
 import xml.etree.ElementTree as ET
 
 
 class BGGDataClient:
-    def __init__(self, max_retries=3, retry_delay=2):
+    # Upper bound BGG accepts for comma-separated ids on /thing
+    MAX_IDS_PER_REQUEST = 20
+
+    def __init__(self, max_retries=3, backoff_factor=0.5,
+                 cache_dir: Optional[str] = "data/bgg_cache",
+                 cache_expire_after: int = 86400):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.max_retries = max_retries
-        self.retry_delay = retry_delay
+        self.backoff_factor = backoff_factor
         self.api_base_url = "https://boardgamegeek.com/xmlapi2"
 
+        # Reuse one pooled, keep-alive connection set for every BGG request;
+        # transient failures are retried by urllib3 with exponential backoff
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=self._build_retry())
+        self.session.mount("https://", adapter)
+
+        # On-disk response cache (disabled when cache_dir is None)
+        self.cache_dir = cache_dir
+        self.cache_expire_after = cache_expire_after
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        # In-memory memo of resolved name -> id lookups
+        self._game_id_cache: Dict[str, int] = {}
+
     def _safe_api_call(self, url: str, params: Dict[str, Any]) -> str:
         """
-        Make a safe HTTP GET request with retries.
+        Make a safe HTTP GET request, serving it from the disk cache when possible.
         """
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.get(url, params=params)
-                response.raise_for_status()  # Raise HTTP errors
-                return response.text
-            except requests.RequestException as e:
-                self.logger.warning(f"API call failed (Attempt {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                else:
-                    raise
+        if not self.cache_dir:
+            return self._request(url, params).text
+
+        key = hashlib.sha1(f"{url}?{urlencode(sorted(params.items()))}".encode()).hexdigest()
+        xml_path = os.path.join(self.cache_dir, f"{key}.xml")
+        etag_path = os.path.join(self.cache_dir, f"{key}.etag")
+
+        # Fresh cache hit: no network access at all
+        if os.path.exists(xml_path) and time.time() - os.path.getmtime(xml_path) < self.cache_expire_after:
+            with open(xml_path, "r", encoding="utf-8") as f:
+                return f.read()
+
+        # Stale entry: revalidate with the stored ETag
+        headers = {}
+        if os.path.exists(xml_path) and os.path.exists(etag_path):
+            with open(etag_path, "r", encoding="utf-8") as f:
+                headers["If-None-Match"] = f.read().strip()
+
+        response = self._request(url, params, headers)
+        if response.status_code == 304:
+            os.utime(xml_path)
+            with open(xml_path, "r", encoding="utf-8") as f:
+                return f.read()
+
+        try:
+            self._write_cache_file(xml_path, response.text)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._write_cache_file(etag_path, etag)
+            elif os.path.exists(etag_path):
+                os.remove(etag_path)
+        except OSError as e:
+            self.logger.warning("Failed to write cache entry for %s: %s", url, e)
+            # Never leave an entry whose body and ETag may not match
+            for path in (xml_path, etag_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        return response.text
+
+    def _write_cache_file(self, path: str, text: str):
+        """
+        Atomically write a cache file, so readers never see a partial entry.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _build_retry(self) -> Retry:
+        """
+        Build the retry policy mounted on the session.
+        """
+        retry_kwargs = dict(
+            # max_retries counts attempts, so the first one is not a retry
+            total=max(self.max_retries - 1, 0),
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+        )
+        try:
+            # Jitter spreads concurrent retries out (urllib3 >= 2.0)
+            return Retry(backoff_jitter=self.backoff_factor, **retry_kwargs)
+        except TypeError:
+            return Retry(**retry_kwargs)
+
+    def _request(self, url: str, params: Dict[str, Any],
+                 headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Make a safe HTTP GET request; retries are handled by the session adapter.
+        """
+        try:
+            response = self.session.get(url, params=params, headers=headers, timeout=(5, 30))
+            response.raise_for_status()  # Raise HTTP errors
+            return response
+        except requests.RequestException as e:
+            self.logger.warning("API call to %s failed: %s", url, e)
+            raise
 
     def _parse_xml(self, xml_string: str) -> ET.Element:
         """
@@ -35,13 +136,44 @@ class BGGDataClient:
         try:
             return ET.fromstring(xml_string)
         except ET.ParseError as e:
-            self.logger.error(f"Failed to parse XML: {e}")
+            self.logger.error("Failed to parse XML: %s", e)
+            raise
+
+    def _parse_thing_xml(self, xml_string: str) -> Tuple[ET.Element, Dict[Optional[int], List[Dict[str, Any]]]]:
+        """
+        Stream-parse a /thing response, extracting comments as they are read.
+
+        Comments are grouped by the id of the <item> they belong to. Each <comment>
+        element is cleared once its attributes are copied, so large comment pages
+        never stay fully materialized in the tree.
+        """
+        comments_by_id: Dict[Optional[int], List[Dict[str, Any]]] = {}
+        comments: List[Dict[str, Any]] = []
+        try:
+            parser = ET.iterparse(BytesIO(xml_string.encode("utf-8")), events=("start", "end"))
+            _, root = next(parser)
+            for event, element in parser:
+                if event == "start" and element.tag == "item":
+                    comments = comments_by_id.setdefault(self._parse_int(element.get("id")), [])
+                elif event == "end" and element.tag == "comment":
+                    comments.append({
+                        "username": element.get("username"),
+                        "rating": element.get("rating"),
+                        "value": element.get("value"),
+                    })
+                    element.clear()
+            return root, comments_by_id
+        except ET.ParseError as e:
+            self.logger.error("Failed to parse XML: %s", e)
             raise
 
     def get_game_id(self, game_name: str) -> Optional[int]:
         """
         Retrieve the game ID based on the game name.
         """
+        if game_name in self._game_id_cache:
+            return self._game_id_cache[game_name]
+
         search_url = f"{self.api_base_url}/search"
         params = {"query": game_name, "type": "boardgame"}
         try:
@@ -49,12 +181,14 @@ class BGGDataClient:
             root = self._parse_xml(xml_data)
             game = root.find("item")
             if game is not None:
-                return int(game.get("id"))
+                game_id = int(game.get("id"))
+                self._game_id_cache[game_name] = game_id
+                return game_id
             else:
-                self.logger.warning(f"No game found for name: {game_name}")
+                self.logger.warning("No game found for name: %s", game_name)
                 return None
         except Exception as e:
-            self.logger.error(f"Failed to retrieve game ID for {game_name}: {e}")
+            self.logger.error("Failed to retrieve game ID for %s: %s", game_name, e)
             return None
 
     def get_game_info(self, game_id: int) -> Optional[Dict[str, Any]]:
@@ -68,17 +202,12 @@ class BGGDataClient:
             root = self._parse_xml(xml_data)
             item = root.find("item")
             if item is not None:
-                return {
-                    "id": game_id,
-                    "name": item.find("name").get("value") if item.find("name") is not None else None,
-                    "year": item.find("yearpublished").get("value") if item.find("yearpublished") is not None else None,
-                    "description": item.find("description").text if item.find("description") is not None else None,
-                }
+                return self._extract_info(item, game_id)
             else:
-                self.logger.warning(f"No information found for game ID: {game_id}")
+                self.logger.warning("No information found for game ID: %s", game_id)
                 return None
         except Exception as e:
-            self.logger.error(f"Failed to retrieve game info for ID {game_id}: {e}")
+            self.logger.error("Failed to retrieve game info for ID %s: %s", game_id, e)
             return None
 
     def get_game_comments(self, game_id: int, max_comments: int = 100) -> List[Dict[str, Any]]:
@@ -89,19 +218,84 @@ class BGGDataClient:
         params = {"id": game_id, "comments": 1, "ratingcomments":1, "pagesize": max_comments}
         try:
             xml_data = self._safe_api_call(thing_url, params)
-            root = self._parse_xml(xml_data)
-            comments = []
-            for comment in root.findall(".//comment"):
-                comments.append({
-                    "username": comment.get("username"),
-                    "rating": comment.get("rating"),
-                    "value": comment.get("value"),
-                })
-            return comments
+            _, comments_by_id = self._parse_thing_xml(xml_data)
+            return comments_by_id.get(game_id, [])
         except Exception as e:
-            self.logger.error(f"Failed to retrieve comments for game ID {game_id}: {e}")
+            self.logger.error("Failed to retrieve comments for game ID %s: %s", game_id, e)
             return []
 
+    def get_game_bundle(self, game_id: int, max_comments: int = 100) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the main information and the comments of a game with a single request.
+        """
+        bundles = self.get_games_bulk([game_id], max_comments)
+        if bundles:
+            return bundles[0]
+        self.logger.warning("No information found for game ID: %s", game_id)
+        return None
+
+    def get_games_bulk(self, game_ids: List[int], max_comments: int = 100) -> List[Dict[str, Any]]:
+        """
+        Retrieve information and comments for several games with a single request.
+
+        At most MAX_IDS_PER_REQUEST ids are accepted; one bundle is returned per
+        <item> found in the response.
+        """
+        if len(game_ids) > self.MAX_IDS_PER_REQUEST:
+            raise ValueError(f"At most {self.MAX_IDS_PER_REQUEST} ids per request, got {len(game_ids)}")
+
+        thing_url = f"{self.api_base_url}/thing"
+        params = {
+            "id": ",".join(map(str, game_ids)),
+            "comments": 1,
+            "ratingcomments": 1,
+            "pagesize": max_comments,
+        }
+        try:
+            xml_data = self._safe_api_call(thing_url, params)
+            root, comments_by_id = self._parse_thing_xml(xml_data)
+        except Exception as e:
+            self.logger.error("Failed to retrieve games for IDs %s: %s", params["id"], e)
+            return []
+
+        # A malformed item only drops that game, not the whole batch
+        bundles = []
+        for item in root.iterfind("item"):
+            try:
+                game_id = int(item.get("id"))
+                bundles.append({
+                    "info": self._extract_info(item, game_id),
+                    "comments": comments_by_id.get(game_id, []),
+                })
+            except Exception as e:
+                self.logger.error("Failed to extract game ID %s: %s", item.get("id"), e)
+        return bundles
+
+    @staticmethod
+    def _extract_info(item: ET.Element, game_id: int) -> Dict[str, Any]:
+        """
+        Extract the main information of a game from its <item> element.
+        """
+        name_el = item.find("name")
+        year_el = item.find("yearpublished")
+        desc_el = item.find("description")
+        return {
+            "id": game_id,
+            "name": name_el.get("value") if name_el is not None else None,
+            "year": BGGDataClient._parse_int(year_el.get("value")) if year_el is not None else None,
+            "description": desc_el.text if desc_el is not None else None,
+        }
+
+    @staticmethod
+    def _parse_int(value: Optional[str]) -> Optional[int]:
+        """
+        Parse an integer attribute, returning None when it is missing or malformed.
+        """
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     client = BGGDataClient()
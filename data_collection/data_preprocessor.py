@@ -1,62 +1,158 @@
 import re
 import logging
-from typing import List, Dict, Any
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import Pool
+from typing import List, Dict, Any, FrozenSet, Iterable, Iterator, Optional, Tuple
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+
+# Compiled once at import; shared by every preprocessor instance
+_CLEAN_RE = re.compile(r'[^a-z\s]+')
+_STOPWORDS: FrozenSet[str] = frozenset()
+_NLTK_READY = False
+
+
+def _ensure_nltk_resources():
+    """
+    Download the required NLTK resources once per process, only if missing
+
+    Raises RuntimeError if the download fails, leaving the guard unset so a later
+    call retries.
+    """
+    global _NLTK_READY
+    if _NLTK_READY:
+        return
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        # nltk.download reports failure through its return value, not an exception
+        if not nltk.download('stopwords', quiet=True):
+            raise RuntimeError("could not download 'stopwords'")
+    _NLTK_READY = True
+
+
+def _load_stopwords() -> FrozenSet[str]:
+    """
+    Build the English stopword set once per process
+    """
+    global _STOPWORDS
+    if not _STOPWORDS:
+        _STOPWORDS = frozenset(stopwords.words('english'))
+        # Results memoized before the stopwords were available are stale
+        _preprocess_text.cache_clear()
+    return _STOPWORDS
+
+
+def _init_worker():
+    """
+    Load the stopword set in a freshly started pool worker
+    """
+    try:
+        _load_stopwords()
+    except LookupError:
+        pass
+
+
+@lru_cache(maxsize=200_000)
+def _preprocess_text(text: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Clean and tokenize text in a single pass
+
+    Memoized on the raw text, so repeated comments are only processed once.
+    """
+    clean = _CLEAN_RE.sub('', text.lower())
+    return clean, tuple(token for token in clean.split() if token not in _STOPWORDS)
+
 
 class DataPreprocessor:
-    def __init__(self):
+    def __init__(self, n_jobs: Optional[int] = None, parallel_threshold: int = 5000):
         self.logger = logging.getLogger(self.__class__.__name__)
-        
+        self.n_jobs = n_jobs
+        self.parallel_threshold = parallel_threshold
+
         # Download necessary NLTK resources
         try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
+            _ensure_nltk_resources()
         except Exception as e:
             self.logger.warning(f"NLTK resource download failed: {e}")
 
+        try:
+            _load_stopwords()
+        except LookupError as e:
+            self.logger.warning(f"NLTK stopwords unavailable: {e}")
+
     def clean_text(self, text: str) -> str:
         """
         Clean and normalize text
         """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and numbers
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
-        
-        return text
+        # Lowercase, then remove special characters and numbers
+        return _CLEAN_RE.sub('', text.lower())
 
     def tokenize(self, text: str) -> List[str]:
         """
         Tokenize and remove stopwords
         """
         try:
-            tokens = word_tokenize(text)
-            stop_words = set(stopwords.words('english'))
-            tokens = [token for token in tokens if token not in stop_words]
-            return tokens
+            return [token for token in text.split() if token not in _STOPWORDS]
         except Exception as e:
             self.logger.error(f"Tokenization error: {e}")
             return []
 
-    def preprocess_dataset(self, dataset: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    def preprocess_text(self, text: str) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Clean and tokenize text in a single pass
+        """
+        return _preprocess_text(text)
+
+    def preprocess_dataset(self, dataset: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, List[Any]]]:
         """
         Preprocess entire dataset
+
+        Each game's comments are returned column-wise, as parallel lists under the
+        'username', 'rating', 'value', 'clean_text' and 'tokens' keys.
+        Large datasets are processed across a pool of worker processes.
+        """
+        texts = [comment['value'] for comments in dataset.values() for comment in comments]
+        results = iter(self._preprocess_texts(texts))
+
+        return {
+            game: self._to_columns(comments, list(islice(results, len(comments))))
+            for game, comments in dataset.items()
+        }
+
+    def iter_preprocess_dataset(
+        self, items: Iterable[Tuple[str, List[Dict[str, Any]]]]
+    ) -> Iterator[Tuple[str, Dict[str, List[Any]]]]:
+        """
+        Preprocess a stream of (game, comments) pairs, yielding each game as it is done
+        """
+        for game, comments in items:
+            results = self._preprocess_texts([comment['value'] for comment in comments])
+            yield game, self._to_columns(comments, results)
+
+    def _preprocess_texts(self, texts: List[str]) -> List[Tuple[str, Tuple[str, ...]]]:
+        """
+        Clean and tokenize all texts, in a process pool if there are many
+        """
+        if self.n_jobs != 1 and len(texts) >= self.parallel_threshold:
+            # Workers have their own cold caches, so only ship each distinct text once
+            unique = list(dict.fromkeys(texts))
+            with Pool(self.n_jobs, initializer=_init_worker) as pool:
+                results = dict(zip(unique, pool.map(_preprocess_text, unique, chunksize=256)))
+            return [results[text] for text in texts]
+        return [_preprocess_text(text) for text in texts]
+
+    @staticmethod
+    def _to_columns(comments: List[Dict[str, Any]],
+                    results: List[Tuple[str, Tuple[str, ...]]]) -> Dict[str, List[Any]]:
+        """
+        Lay out comments and their preprocessing results as parallel lists
         """
-        preprocessed_dataset = {}
-        
-        for game, comments in dataset.items():
-            preprocessed_comments = []
-            
-            for comment in comments:
-                preprocessed_comment = comment.copy()
-                preprocessed_comment['clean_text'] = self.clean_text(comment['value'])
-                preprocessed_comment['tokens'] = self.tokenize(preprocessed_comment['clean_text'])
-                
-                preprocessed_comments.append(preprocessed_comment)
-            
-            preprocessed_dataset[game] = preprocessed_comments
-        
-        return preprocessed_dataset
\ No newline at end of file
+        return {
+            'username': [comment['username'] for comment in comments],
+            'rating': [comment['rating'] for comment in comments],
+            'value': [comment['value'] for comment in comments],
+            'clean_text': [clean for clean, _ in results],
+            'tokens': [tokens for _, tokens in results],
+        }
@@ -1,17 +1,40 @@
 import os
+import re
 import json
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import logging
 from .bgg_api_client import BGGDataClient
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors raised by whichever JSON reader iter_local_dataset ends up using
+_JSON_PARSE_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+# Anything other than alphanumerics (Unicode-aware, as str.isalnum) and "._-"
+_SANITIZE_RE = re.compile(r"[^\w.-]")
+
 
 class DataRetriever:
     def __init__(self, 
                  output_dir: str = "data/raw_comments", 
-                 download_path: Optional[str] = None):
+                 download_path: Optional[str] = None,
+                 max_workers: int = 8,
+                 save_per_game: bool = False):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.output_dir = output_dir
         self.download_path = download_path
+        self.max_workers = max_workers
+        self.save_per_game = save_per_game
+        self.game_info: Dict[str, Dict[str, Any]] = {}
         self.bgg_client = BGGDataClient()
         
         # Ensure output directory exists
@@ -23,26 +46,40 @@ class DataRetriever:
         """
         Retrieve comments for multiple games by name.
         """
-        all_comments = {}
-        for game_name in games:
-            try:
-                # Retrieve game ID
-                game_id = self.bgg_client.get_game_id(game_name)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Resolve names to ids concurrently; the client's pooled session is shared across workers
+            names_by_id: Dict[int, List[str]] = {}
+            for game_name, game_id in zip(games, executor.map(self.bgg_client.get_game_id, games)):
                 if game_id is None:
                     self.logger.warning(f"Game '{game_name}' not found.")
                     continue
+                names_by_id.setdefault(game_id, []).append(game_name)
+
+            # Fetch info and comments for up to MAX_IDS_PER_REQUEST games per request
+            ids = list(names_by_id)
+            step = self.bgg_client.MAX_IDS_PER_REQUEST
+            chunks = [ids[i:i + step] for i in range(0, len(ids), step)]
+            bundles_by_id = {}
+            for bundles in executor.map(lambda chunk: self.bgg_client.get_games_bulk(chunk, max_comments), chunks):
+                for bundle in bundles:
+                    bundles_by_id[bundle["info"]["id"]] = bundle
 
-                # Retrieve comments
-                comments = self.bgg_client.get_game_comments(game_id, max_comments)
+        all_comments = {}
+        for game_id, game_names in names_by_id.items():
+            bundle = bundles_by_id.get(game_id)
+            if bundle is None:
+                self.logger.error(f"Error retrieving comments for {game_names}.")
+                continue
+            comments = bundle["comments"]
+            for game_name in game_names:
+                self.game_info[game_name] = bundle["info"]
                 all_comments[game_name] = comments
                 self.logger.info(f"Retrieved {len(comments)} comments for '{game_name}'.")
 
-                # Save individual game comments
-                self._save_game_comments(game_name, comments)
+                # Save individual game comments only on request; the full dataset holds them too
+                if self.save_per_game:
+                    self._save_game_comments(game_name, comments)
 
-            except Exception as e:
-                self.logger.error(f"Error retrieving comments for '{game_name}': {e}")
-        
         # Save full dataset
         self._save_full_dataset(all_comments)
         return all_comments
@@ -54,8 +91,7 @@ class DataRetriever:
         sanitized_name = self._sanitize_filename(game_name)
         game_filename = os.path.join(self.output_dir, f"{sanitized_name}_comments.json")
         try:
-            with open(game_filename, "w", encoding="utf-8") as f:
-                json.dump(comments, f, ensure_ascii=False, indent=2)
+            self._write_json(game_filename, comments)
             self.logger.info(f"Saved comments for '{game_name}' to {game_filename}.")
         except IOError as e:
             self.logger.error(f"Failed to save comments for '{game_name}': {e}")
@@ -66,8 +102,7 @@ class DataRetriever:
         """
         full_dataset_path = os.path.join(self.output_dir, "full_comments_dataset.json")
         try:
-            with open(full_dataset_path, "w", encoding="utf-8") as f:
-                json.dump(dataset, f, ensure_ascii=False, indent=2)
+            self._write_json(full_dataset_path, dataset)
             self.logger.info(f"Saved full dataset to {full_dataset_path}.")
         except IOError as e:
             self.logger.error(f"Failed to save full dataset: {e}")
@@ -78,8 +113,7 @@ class DataRetriever:
         """
         load_path = source or self.download_path or os.path.join(self.output_dir, "full_comments_dataset.json")
         try:
-            with open(load_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json(load_path)
             self.logger.info(f"Loaded dataset from {load_path}.")
             return data
         except FileNotFoundError:
@@ -89,9 +123,58 @@ class DataRetriever:
             self.logger.error(f"Failed to parse JSON at {load_path}: {e}")
             return {}
 
+    def iter_local_dataset(self, source: Optional[str] = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Stream (game_name, comments) pairs from a local dataset file.
+
+        With ijson installed only one game's comments are held in memory at a time;
+        otherwise the file is loaded whole and its items are yielded. A missing file
+        yields nothing; a parse error is logged and re-raised, since games may
+        already have been yielded and the stream would otherwise look complete.
+        """
+        load_path = source or self.download_path or os.path.join(self.output_dir, "full_comments_dataset.json")
+        try:
+            if ijson is None:
+                data = self._read_json(load_path)
+                self.logger.info(f"Loaded dataset from {load_path}.")
+                yield from data.items()
+                return
+
+            with open(load_path, "rb") as f:
+                yield from ijson.kvitems(f, "", use_float=True)
+            self.logger.info(f"Streamed dataset from {load_path}.")
+        except FileNotFoundError:
+            self.logger.error(f"Dataset not found at {load_path}.")
+        except _JSON_PARSE_ERRORS as e:
+            self.logger.error(f"Failed to parse JSON at {load_path}: {e}")
+            raise
+
+    @staticmethod
+    def _write_json(path: str, data: Any):
+        """
+        Serialize data to a JSON file, using orjson when it is available.
+        """
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        """
+        Load a JSON file, using orjson when it is available.
+        """
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
     @staticmethod
     def _sanitize_filename(name: str) -> str:
         """
         Sanitize a string to create a valid filename.
         """
-        return "".join(c if c.isalnum() or c in "._-" else "_" for c in name)
+        return _SANITIZE_RE.sub("_", name)
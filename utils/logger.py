@@ -1,11 +1,31 @@
 # utils/logger.py
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import Dict, Optional, Union, List
+
+
+class _MergingQueueHandler(QueueHandler):
+    """
+    Queue handler that merges the message args on the calling thread
+
+    Args are rendered before the record is enqueued, so later mutation of logged
+    objects cannot change or break the output; the Formatter (including any
+    traceback) and the handler I/O still run on the listener thread.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 class ProjectLogger:
+    # Active instance per logger name, so a re-created logger stops the old listener
+    _active: Dict[str, 'ProjectLogger'] = {}
+
     def __init__(
         self, 
         name: str = 'BoardGameAnalyzer', 
@@ -22,7 +42,11 @@ class ProjectLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(log_level)
 
-        # Clear any existing handlers to prevent duplicate logs
+        # Stop a previous instance's listener, then clear any existing handlers
+        # to prevent duplicate logs
+        previous = ProjectLogger._active.pop(name, None)
+        if previous is not None:
+            previous.stop()
         self.logger.handlers.clear()
 
         # Formatter
@@ -35,7 +59,6 @@ class ProjectLogger:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         console_handler.setLevel(log_level)
-        self.logger.addHandler(console_handler)
 
         # File Handler with rotation
         log_file_path = self.log_dir / f'{name.lower().replace(" ", "_")}.log'
@@ -46,7 +69,32 @@ class ProjectLogger:
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(log_level)
-        self.logger.addHandler(file_handler)
+
+        # Log calls only enqueue records; a background listener formats and writes them
+        self.name = name
+        self._queue = queue.Queue(-1)
+        self.logger.addHandler(_MergingQueueHandler(self._queue))
+        self.listener = QueueListener(
+            self._queue, console_handler, file_handler, respect_handler_level=True
+        )
+        self.listener.start()
+        self._listening = True
+        ProjectLogger._active[name] = self
+        atexit.register(self.stop)
+
+    def stop(self):
+        """
+        Flush pending records, stop the background listener and close its handlers
+        """
+        if not self._listening:
+            return
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        self._listening = False
+        if ProjectLogger._active.get(self.name) is self:
+            del ProjectLogger._active[self.name]
+        atexit.unregister(self.stop)
 
     def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         """
@@ -100,12 +148,13 @@ def log_method(logger: Optional[logging.Logger] = None, level: int = logging.INF
             # Use provided logger or get a default one
             method_logger = logger or logging.getLogger(func.__module__)
             
-            # Log method entry
-            method_logger.log(
-                level, 
-                f"Calling {func.__name__} "
-                f"with args: {args}, kwargs: {kwargs}"
-            )
+            # Log method entry; args are only formatted if the record is emitted
+            if method_logger.isEnabledFor(level):
+                method_logger.log(
+                    level,
+                    "Calling %s with args: %s, kwargs: %s",
+                    func.__name__, args, kwargs
+                )
             
             # Track execution time
             start_time = time.time()
@@ -116,15 +165,15 @@ def log_method(logger: Optional[logging.Logger] = None, level: int = logging.INF
                 # Log successful execution
                 method_logger.log(
                     level,
-                    f"{func.__name__} completed in "
-                    f"{time.time() - start_time:.4f} seconds"
+                    "%s completed in %.4f seconds",
+                    func.__name__, time.time() - start_time
                 )
                 return result
             
             except Exception as e:
                 # Log any exceptions
                 method_logger.exception(
-                    f"Exception in {func.__name__}: {str(e)}"
+                    "Exception in %s: %s", func.__name__, e
                 )
                 raise
         return wrapper